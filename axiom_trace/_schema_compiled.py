@@ -0,0 +1,347 @@
+"""
+Pre-compiled frame schema validator.
+
+Generated by tools/regen_schema.py - do not edit by hand.
+"""
+
+SCHEMA_SHA256 = "c7ca6a5d74a9b81c2598486af33bf614828e69bfe5fd8a962614c18b7155a97a"
+
+VERSION = "2.22.2"
+from decimal import Decimal
+from fastjsonschema import JsonSchemaValueException, JsonSchemaValuesException
+
+
+NoneType = type(None)
+
+def validate_https___axiom_trace_dev_schemas_axiom_frame_v1_2_json(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'$schema': 'http://json-schema.org/draft-07/schema#', '$id': 'https://axiom-trace.dev/schemas/axiom_frame_v1_2.json', 'title': 'Axiom Frame v1.2', 'description': 'Schema for a single immutable event record in the Axiom Trace vault. v1.2 adds agent-friendly fields for retrospection.', 'type': 'object', 'required': ['frame_id', 'session_id', 'timestamp', 'event_type', 'actor', 'content', 'metadata', 'vector_key', 'prev_hash', 'frame_hash'], 'properties': {'frame_id': {'type': 'string', 'format': 'uuid', 'description': 'UUIDv4 identifier for this frame'}, 'session_id': {'type': 'string', 'description': 'Identifier for the session this frame belongs to'}, 'timestamp': {'type': 'string', 'format': 'date-time', 'description': 'ISO-8601 UTC timestamp with milliseconds'}, 'event_type': {'type': 'string', 'description': 'Type of event this frame represents'}, 'actor': {'type': 'object', 'required': ['type', 'id'], 'properties': {'type': {'type': 'string', 'enum': ['agent', 'user', 'system', 'tool'], 'description': 'Type of actor'}, 'id': {'type': 'string', 'maxLength': 128, 'description': 'Unique identifier for the actor'}, 'name': {'type': 'string', 'maxLength': 128, 'description': 'Optional human-readable name'}}, 'additionalProperties': False}, 'content': {'type': 'object', 'description': 'Content of the frame with agent-friendly fields', 'properties': {'text': {'type': 'string', 'maxLength': 200000, 'description': 'Text content (max 200,000 chars)'}, 'json': {'type': 'object', 'description': 'JSON content (max 1,000,000 bytes serialized)'}, 'mime_type': {'type': 'string', 'default': 'text/plain', 'description': 'MIME type of content'}, 'rationale_summary': {'type': 'string', 'maxLength': 2000, 'description': 'Summary of reasoning (required for thought events)'}, 'raw_thought': {'type': 'string', 'maxLength': 50000, 'description': 'Raw thought content (optional)'}, 'input': {'type': 'string', 'maxLength': 10000, 'description': 'What prompted this action (user request, trigger) - AGENT FRIENDLY'}, 'output': {'type': 'string', 'maxLength': 10000, 'description': 'What was produced (result, artifact) - AGENT FRIENDLY'}, 'reasoning': {'type': 'string', 'maxLength': 5000, 'description': 'Why this action was taken - AGENT FRIENDLY'}}, 'additionalProperties': False}, 'metadata': {'type': 'object', 'description': 'Additional metadata for the frame', 'properties': {'model_name': {'type': 'string'}, 'model_provider': {'type': 'string'}, 'token_usage': {'type': 'object', 'properties': {'prompt': {'type': 'integer'}, 'completion': {'type': 'integer'}, 'total': {'type': 'integer'}}, 'additionalProperties': False}, 'latency_ms': {'type': 'integer'}, 'risk_level': {'type': 'string', 'enum': ['low', 'medium', 'high']}, 'tags': {'type': 'array', 'items': {'type': 'string', 'maxLength': 64}, 'maxItems': 50}, 'tool_name': {'type': 'string'}, 'tool_args_hash': {'type': 'string'}, 'tool_output_hash': {'type': 'string'}}, 'additionalProperties': True}, 'vector_key': {'type': 'string', 'maxLength': 512, 'description': 'Key for vector search indexing'}, 'prev_hash': {'type': 'string', 'description': 'Hash of the previous frame (empty string for first frame)'}, 'frame_hash': {'type': 'string', 'description': "SHA-256 hash of this frame's canonical representation"}, 'success': {'type': 'boolean', 'description': 'Whether the action succeeded - AGENT FRIENDLY'}, 'caused_by': {'type': 'string', 'description': 'frame_id of the event that triggered this action - AGENT FRIENDLY'}, 'artifacts': {'type': 'array', 'items': {'type': 'string', 'maxLength': 500}, 'maxItems': 100, 'description': 'List of files/resources created or modified - AGENT FRIENDLY'}}, 'additionalProperties': False, 'allOf': [{'if': {'properties': {'event_type': {'const': 'thought'}}, 'required': ['event_type']}, 'then': {'properties': {'content': {'required': ['rationale_summary']}}}}, {'if': {'properties': {'event_type': {'enum': ['tool_call', 'tool_output']}}, 'required': ['event_type']}, 'then': {'properties': {'metadata': {'required': ['tool_name']}}}}]}, rule='type')
+    try:
+        data_is_dict = isinstance(data, dict)
+        if data_is_dict:
+            data__missing_keys = set(['event_type']) - data.keys()
+            if data__missing_keys:
+                raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'properties': {'event_type': {'const': 'thought'}}, 'required': ['event_type']}, rule='required')
+            data_keys = set(data.keys())
+            if "event_type" in data_keys:
+                data_keys.remove("event_type")
+                data__eventtype = data["event_type"]
+                if not (isinstance(data__eventtype, str) and data__eventtype == 'thought'):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".event_type must be same as const definition: thought", value=data__eventtype, name="" + (name_prefix or "data") + ".event_type", definition={'const': 'thought'}, rule='const')
+    except (JsonSchemaValueException, JsonSchemaValuesException):
+        pass
+    else:
+        data_is_dict = isinstance(data, dict)
+        if data_is_dict:
+            data_keys = set(data.keys())
+            if "content" in data_keys:
+                data_keys.remove("content")
+                data__content = data["content"]
+                data__content_is_dict = isinstance(data__content, dict)
+                if data__content_is_dict:
+                    data__content__missing_keys = set(['rationale_summary']) - data__content.keys()
+                    if data__content__missing_keys:
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".content must contain " + (str(sorted(data__content__missing_keys)) + " properties"), value=data__content, name="" + (name_prefix or "data") + ".content", definition={'required': ['rationale_summary']}, rule='required')
+    try:
+        data_is_dict = isinstance(data, dict)
+        if data_is_dict:
+            data__missing_keys = set(['event_type']) - data.keys()
+            if data__missing_keys:
+                raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'properties': {'event_type': {'enum': ['tool_call', 'tool_output']}}, 'required': ['event_type']}, rule='required')
+            data_keys = set(data.keys())
+            if "event_type" in data_keys:
+                data_keys.remove("event_type")
+                data__eventtype = data["event_type"]
+                if not (isinstance(data__eventtype, str) and data__eventtype == 'tool_call' or isinstance(data__eventtype, str) and data__eventtype == 'tool_output'):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".event_type must be one of ['tool_call', 'tool_output']", value=data__eventtype, name="" + (name_prefix or "data") + ".event_type", definition={'enum': ['tool_call', 'tool_output']}, rule='enum')
+    except (JsonSchemaValueException, JsonSchemaValuesException):
+        pass
+    else:
+        data_is_dict = isinstance(data, dict)
+        if data_is_dict:
+            data_keys = set(data.keys())
+            if "metadata" in data_keys:
+                data_keys.remove("metadata")
+                data__metadata = data["metadata"]
+                data__metadata_is_dict = isinstance(data__metadata, dict)
+                if data__metadata_is_dict:
+                    data__metadata__missing_keys = set(['tool_name']) - data__metadata.keys()
+                    if data__metadata__missing_keys:
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".metadata must contain " + (str(sorted(data__metadata__missing_keys)) + " properties"), value=data__metadata, name="" + (name_prefix or "data") + ".metadata", definition={'required': ['tool_name']}, rule='required')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['frame_id', 'session_id', 'timestamp', 'event_type', 'actor', 'content', 'metadata', 'vector_key', 'prev_hash', 'frame_hash']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'$schema': 'http://json-schema.org/draft-07/schema#', '$id': 'https://axiom-trace.dev/schemas/axiom_frame_v1_2.json', 'title': 'Axiom Frame v1.2', 'description': 'Schema for a single immutable event record in the Axiom Trace vault. v1.2 adds agent-friendly fields for retrospection.', 'type': 'object', 'required': ['frame_id', 'session_id', 'timestamp', 'event_type', 'actor', 'content', 'metadata', 'vector_key', 'prev_hash', 'frame_hash'], 'properties': {'frame_id': {'type': 'string', 'format': 'uuid', 'description': 'UUIDv4 identifier for this frame'}, 'session_id': {'type': 'string', 'description': 'Identifier for the session this frame belongs to'}, 'timestamp': {'type': 'string', 'format': 'date-time', 'description': 'ISO-8601 UTC timestamp with milliseconds'}, 'event_type': {'type': 'string', 'description': 'Type of event this frame represents'}, 'actor': {'type': 'object', 'required': ['type', 'id'], 'properties': {'type': {'type': 'string', 'enum': ['agent', 'user', 'system', 'tool'], 'description': 'Type of actor'}, 'id': {'type': 'string', 'maxLength': 128, 'description': 'Unique identifier for the actor'}, 'name': {'type': 'string', 'maxLength': 128, 'description': 'Optional human-readable name'}}, 'additionalProperties': False}, 'content': {'type': 'object', 'description': 'Content of the frame with agent-friendly fields', 'properties': {'text': {'type': 'string', 'maxLength': 200000, 'description': 'Text content (max 200,000 chars)'}, 'json': {'type': 'object', 'description': 'JSON content (max 1,000,000 bytes serialized)'}, 'mime_type': {'type': 'string', 'default': 'text/plain', 'description': 'MIME type of content'}, 'rationale_summary': {'type': 'string', 'maxLength': 2000, 'description': 'Summary of reasoning (required for thought events)'}, 'raw_thought': {'type': 'string', 'maxLength': 50000, 'description': 'Raw thought content (optional)'}, 'input': {'type': 'string', 'maxLength': 10000, 'description': 'What prompted this action (user request, trigger) - AGENT FRIENDLY'}, 'output': {'type': 'string', 'maxLength': 10000, 'description': 'What was produced (result, artifact) - AGENT FRIENDLY'}, 'reasoning': {'type': 'string', 'maxLength': 5000, 'description': 'Why this action was taken - AGENT FRIENDLY'}}, 'additionalProperties': False}, 'metadata': {'type': 'object', 'description': 'Additional metadata for the frame', 'properties': {'model_name': {'type': 'string'}, 'model_provider': {'type': 'string'}, 'token_usage': {'type': 'object', 'properties': {'prompt': {'type': 'integer'}, 'completion': {'type': 'integer'}, 'total': {'type': 'integer'}}, 'additionalProperties': False}, 'latency_ms': {'type': 'integer'}, 'risk_level': {'type': 'string', 'enum': ['low', 'medium', 'high']}, 'tags': {'type': 'array', 'items': {'type': 'string', 'maxLength': 64}, 'maxItems': 50}, 'tool_name': {'type': 'string'}, 'tool_args_hash': {'type': 'string'}, 'tool_output_hash': {'type': 'string'}}, 'additionalProperties': True}, 'vector_key': {'type': 'string', 'maxLength': 512, 'description': 'Key for vector search indexing'}, 'prev_hash': {'type': 'string', 'description': 'Hash of the previous frame (empty string for first frame)'}, 'frame_hash': {'type': 'string', 'description': "SHA-256 hash of this frame's canonical representation"}, 'success': {'type': 'boolean', 'description': 'Whether the action succeeded - AGENT FRIENDLY'}, 'caused_by': {'type': 'string', 'description': 'frame_id of the event that triggered this action - AGENT FRIENDLY'}, 'artifacts': {'type': 'array', 'items': {'type': 'string', 'maxLength': 500}, 'maxItems': 100, 'description': 'List of files/resources created or modified - AGENT FRIENDLY'}}, 'additionalProperties': False, 'allOf': [{'if': {'properties': {'event_type': {'const': 'thought'}}, 'required': ['event_type']}, 'then': {'properties': {'content': {'required': ['rationale_summary']}}}}, {'if': {'properties': {'event_type': {'enum': ['tool_call', 'tool_output']}}, 'required': ['event_type']}, 'then': {'properties': {'metadata': {'required': ['tool_name']}}}}]}, rule='required')
+        data_keys = set(data.keys())
+        if "frame_id" in data_keys:
+            data_keys.remove("frame_id")
+            data__frameid = data["frame_id"]
+            if not isinstance(data__frameid, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".frame_id must be string", value=data__frameid, name="" + (name_prefix or "data") + ".frame_id", definition={'type': 'string', 'format': 'uuid', 'description': 'UUIDv4 identifier for this frame'}, rule='type')
+        if "session_id" in data_keys:
+            data_keys.remove("session_id")
+            data__sessionid = data["session_id"]
+            if not isinstance(data__sessionid, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".session_id must be string", value=data__sessionid, name="" + (name_prefix or "data") + ".session_id", definition={'type': 'string', 'description': 'Identifier for the session this frame belongs to'}, rule='type')
+        if "timestamp" in data_keys:
+            data_keys.remove("timestamp")
+            data__timestamp = data["timestamp"]
+            if not isinstance(data__timestamp, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".timestamp must be string", value=data__timestamp, name="" + (name_prefix or "data") + ".timestamp", definition={'type': 'string', 'format': 'date-time', 'description': 'ISO-8601 UTC timestamp with milliseconds'}, rule='type')
+        if "event_type" in data_keys:
+            data_keys.remove("event_type")
+            data__eventtype = data["event_type"]
+            if not isinstance(data__eventtype, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".event_type must be string", value=data__eventtype, name="" + (name_prefix or "data") + ".event_type", definition={'type': 'string', 'description': 'Type of event this frame represents'}, rule='type')
+        if "actor" in data_keys:
+            data_keys.remove("actor")
+            data__actor = data["actor"]
+            if not isinstance(data__actor, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".actor must be object", value=data__actor, name="" + (name_prefix or "data") + ".actor", definition={'type': 'object', 'required': ['type', 'id'], 'properties': {'type': {'type': 'string', 'enum': ['agent', 'user', 'system', 'tool'], 'description': 'Type of actor'}, 'id': {'type': 'string', 'maxLength': 128, 'description': 'Unique identifier for the actor'}, 'name': {'type': 'string', 'maxLength': 128, 'description': 'Optional human-readable name'}}, 'additionalProperties': False}, rule='type')
+            data__actor_is_dict = isinstance(data__actor, dict)
+            if data__actor_is_dict:
+                data__actor__missing_keys = set(['type', 'id']) - data__actor.keys()
+                if data__actor__missing_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".actor must contain " + (str(sorted(data__actor__missing_keys)) + " properties"), value=data__actor, name="" + (name_prefix or "data") + ".actor", definition={'type': 'object', 'required': ['type', 'id'], 'properties': {'type': {'type': 'string', 'enum': ['agent', 'user', 'system', 'tool'], 'description': 'Type of actor'}, 'id': {'type': 'string', 'maxLength': 128, 'description': 'Unique identifier for the actor'}, 'name': {'type': 'string', 'maxLength': 128, 'description': 'Optional human-readable name'}}, 'additionalProperties': False}, rule='required')
+                data__actor_keys = set(data__actor.keys())
+                if "type" in data__actor_keys:
+                    data__actor_keys.remove("type")
+                    data__actor__type = data__actor["type"]
+                    if not isinstance(data__actor__type, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".actor.type must be string", value=data__actor__type, name="" + (name_prefix or "data") + ".actor.type", definition={'type': 'string', 'enum': ['agent', 'user', 'system', 'tool'], 'description': 'Type of actor'}, rule='type')
+                    if not (isinstance(data__actor__type, str) and data__actor__type == 'agent' or isinstance(data__actor__type, str) and data__actor__type == 'user' or isinstance(data__actor__type, str) and data__actor__type == 'system' or isinstance(data__actor__type, str) and data__actor__type == 'tool'):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".actor.type must be one of ['agent', 'user', 'system', 'tool']", value=data__actor__type, name="" + (name_prefix or "data") + ".actor.type", definition={'type': 'string', 'enum': ['agent', 'user', 'system', 'tool'], 'description': 'Type of actor'}, rule='enum')
+                if "id" in data__actor_keys:
+                    data__actor_keys.remove("id")
+                    data__actor__id = data__actor["id"]
+                    if not isinstance(data__actor__id, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".actor.id must be string", value=data__actor__id, name="" + (name_prefix or "data") + ".actor.id", definition={'type': 'string', 'maxLength': 128, 'description': 'Unique identifier for the actor'}, rule='type')
+                    if isinstance(data__actor__id, str):
+                        data__actor__id_len = len(data__actor__id)
+                        if data__actor__id_len > 128:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".actor.id must be shorter than or equal to 128 characters", value=data__actor__id, name="" + (name_prefix or "data") + ".actor.id", definition={'type': 'string', 'maxLength': 128, 'description': 'Unique identifier for the actor'}, rule='maxLength')
+                if "name" in data__actor_keys:
+                    data__actor_keys.remove("name")
+                    data__actor__name = data__actor["name"]
+                    if not isinstance(data__actor__name, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".actor.name must be string", value=data__actor__name, name="" + (name_prefix or "data") + ".actor.name", definition={'type': 'string', 'maxLength': 128, 'description': 'Optional human-readable name'}, rule='type')
+                    if isinstance(data__actor__name, str):
+                        data__actor__name_len = len(data__actor__name)
+                        if data__actor__name_len > 128:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".actor.name must be shorter than or equal to 128 characters", value=data__actor__name, name="" + (name_prefix or "data") + ".actor.name", definition={'type': 'string', 'maxLength': 128, 'description': 'Optional human-readable name'}, rule='maxLength')
+                if data__actor_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".actor must not contain "+str(data__actor_keys)+" properties", value=data__actor, name="" + (name_prefix or "data") + ".actor", definition={'type': 'object', 'required': ['type', 'id'], 'properties': {'type': {'type': 'string', 'enum': ['agent', 'user', 'system', 'tool'], 'description': 'Type of actor'}, 'id': {'type': 'string', 'maxLength': 128, 'description': 'Unique identifier for the actor'}, 'name': {'type': 'string', 'maxLength': 128, 'description': 'Optional human-readable name'}}, 'additionalProperties': False}, rule='additionalProperties')
+        if "content" in data_keys:
+            data_keys.remove("content")
+            data__content = data["content"]
+            if not isinstance(data__content, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".content must be object", value=data__content, name="" + (name_prefix or "data") + ".content", definition={'type': 'object', 'description': 'Content of the frame with agent-friendly fields', 'properties': {'text': {'type': 'string', 'maxLength': 200000, 'description': 'Text content (max 200,000 chars)'}, 'json': {'type': 'object', 'description': 'JSON content (max 1,000,000 bytes serialized)'}, 'mime_type': {'type': 'string', 'default': 'text/plain', 'description': 'MIME type of content'}, 'rationale_summary': {'type': 'string', 'maxLength': 2000, 'description': 'Summary of reasoning (required for thought events)'}, 'raw_thought': {'type': 'string', 'maxLength': 50000, 'description': 'Raw thought content (optional)'}, 'input': {'type': 'string', 'maxLength': 10000, 'description': 'What prompted this action (user request, trigger) - AGENT FRIENDLY'}, 'output': {'type': 'string', 'maxLength': 10000, 'description': 'What was produced (result, artifact) - AGENT FRIENDLY'}, 'reasoning': {'type': 'string', 'maxLength': 5000, 'description': 'Why this action was taken - AGENT FRIENDLY'}}, 'additionalProperties': False}, rule='type')
+            data__content_is_dict = isinstance(data__content, dict)
+            if data__content_is_dict:
+                data__content_keys = set(data__content.keys())
+                if "text" in data__content_keys:
+                    data__content_keys.remove("text")
+                    data__content__text = data__content["text"]
+                    if not isinstance(data__content__text, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".content.text must be string", value=data__content__text, name="" + (name_prefix or "data") + ".content.text", definition={'type': 'string', 'maxLength': 200000, 'description': 'Text content (max 200,000 chars)'}, rule='type')
+                    if isinstance(data__content__text, str):
+                        data__content__text_len = len(data__content__text)
+                        if data__content__text_len > 200000:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".content.text must be shorter than or equal to 200000 characters", value=data__content__text, name="" + (name_prefix or "data") + ".content.text", definition={'type': 'string', 'maxLength': 200000, 'description': 'Text content (max 200,000 chars)'}, rule='maxLength')
+                if "json" in data__content_keys:
+                    data__content_keys.remove("json")
+                    data__content__json = data__content["json"]
+                    if not isinstance(data__content__json, (dict)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".content.json must be object", value=data__content__json, name="" + (name_prefix or "data") + ".content.json", definition={'type': 'object', 'description': 'JSON content (max 1,000,000 bytes serialized)'}, rule='type')
+                if "mime_type" in data__content_keys:
+                    data__content_keys.remove("mime_type")
+                    data__content__mimetype = data__content["mime_type"]
+                    if not isinstance(data__content__mimetype, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".content.mime_type must be string", value=data__content__mimetype, name="" + (name_prefix or "data") + ".content.mime_type", definition={'type': 'string', 'default': 'text/plain', 'description': 'MIME type of content'}, rule='type')
+                if "rationale_summary" in data__content_keys:
+                    data__content_keys.remove("rationale_summary")
+                    data__content__rationalesummary = data__content["rationale_summary"]
+                    if not isinstance(data__content__rationalesummary, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".content.rationale_summary must be string", value=data__content__rationalesummary, name="" + (name_prefix or "data") + ".content.rationale_summary", definition={'type': 'string', 'maxLength': 2000, 'description': 'Summary of reasoning (required for thought events)'}, rule='type')
+                    if isinstance(data__content__rationalesummary, str):
+                        data__content__rationalesummary_len = len(data__content__rationalesummary)
+                        if data__content__rationalesummary_len > 2000:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".content.rationale_summary must be shorter than or equal to 2000 characters", value=data__content__rationalesummary, name="" + (name_prefix or "data") + ".content.rationale_summary", definition={'type': 'string', 'maxLength': 2000, 'description': 'Summary of reasoning (required for thought events)'}, rule='maxLength')
+                if "raw_thought" in data__content_keys:
+                    data__content_keys.remove("raw_thought")
+                    data__content__rawthought = data__content["raw_thought"]
+                    if not isinstance(data__content__rawthought, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".content.raw_thought must be string", value=data__content__rawthought, name="" + (name_prefix or "data") + ".content.raw_thought", definition={'type': 'string', 'maxLength': 50000, 'description': 'Raw thought content (optional)'}, rule='type')
+                    if isinstance(data__content__rawthought, str):
+                        data__content__rawthought_len = len(data__content__rawthought)
+                        if data__content__rawthought_len > 50000:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".content.raw_thought must be shorter than or equal to 50000 characters", value=data__content__rawthought, name="" + (name_prefix or "data") + ".content.raw_thought", definition={'type': 'string', 'maxLength': 50000, 'description': 'Raw thought content (optional)'}, rule='maxLength')
+                if "input" in data__content_keys:
+                    data__content_keys.remove("input")
+                    data__content__input = data__content["input"]
+                    if not isinstance(data__content__input, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".content.input must be string", value=data__content__input, name="" + (name_prefix or "data") + ".content.input", definition={'type': 'string', 'maxLength': 10000, 'description': 'What prompted this action (user request, trigger) - AGENT FRIENDLY'}, rule='type')
+                    if isinstance(data__content__input, str):
+                        data__content__input_len = len(data__content__input)
+                        if data__content__input_len > 10000:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".content.input must be shorter than or equal to 10000 characters", value=data__content__input, name="" + (name_prefix or "data") + ".content.input", definition={'type': 'string', 'maxLength': 10000, 'description': 'What prompted this action (user request, trigger) - AGENT FRIENDLY'}, rule='maxLength')
+                if "output" in data__content_keys:
+                    data__content_keys.remove("output")
+                    data__content__output = data__content["output"]
+                    if not isinstance(data__content__output, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".content.output must be string", value=data__content__output, name="" + (name_prefix or "data") + ".content.output", definition={'type': 'string', 'maxLength': 10000, 'description': 'What was produced (result, artifact) - AGENT FRIENDLY'}, rule='type')
+                    if isinstance(data__content__output, str):
+                        data__content__output_len = len(data__content__output)
+                        if data__content__output_len > 10000:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".content.output must be shorter than or equal to 10000 characters", value=data__content__output, name="" + (name_prefix or "data") + ".content.output", definition={'type': 'string', 'maxLength': 10000, 'description': 'What was produced (result, artifact) - AGENT FRIENDLY'}, rule='maxLength')
+                if "reasoning" in data__content_keys:
+                    data__content_keys.remove("reasoning")
+                    data__content__reasoning = data__content["reasoning"]
+                    if not isinstance(data__content__reasoning, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".content.reasoning must be string", value=data__content__reasoning, name="" + (name_prefix or "data") + ".content.reasoning", definition={'type': 'string', 'maxLength': 5000, 'description': 'Why this action was taken - AGENT FRIENDLY'}, rule='type')
+                    if isinstance(data__content__reasoning, str):
+                        data__content__reasoning_len = len(data__content__reasoning)
+                        if data__content__reasoning_len > 5000:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".content.reasoning must be shorter than or equal to 5000 characters", value=data__content__reasoning, name="" + (name_prefix or "data") + ".content.reasoning", definition={'type': 'string', 'maxLength': 5000, 'description': 'Why this action was taken - AGENT FRIENDLY'}, rule='maxLength')
+                if data__content_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".content must not contain "+str(data__content_keys)+" properties", value=data__content, name="" + (name_prefix or "data") + ".content", definition={'type': 'object', 'description': 'Content of the frame with agent-friendly fields', 'properties': {'text': {'type': 'string', 'maxLength': 200000, 'description': 'Text content (max 200,000 chars)'}, 'json': {'type': 'object', 'description': 'JSON content (max 1,000,000 bytes serialized)'}, 'mime_type': {'type': 'string', 'default': 'text/plain', 'description': 'MIME type of content'}, 'rationale_summary': {'type': 'string', 'maxLength': 2000, 'description': 'Summary of reasoning (required for thought events)'}, 'raw_thought': {'type': 'string', 'maxLength': 50000, 'description': 'Raw thought content (optional)'}, 'input': {'type': 'string', 'maxLength': 10000, 'description': 'What prompted this action (user request, trigger) - AGENT FRIENDLY'}, 'output': {'type': 'string', 'maxLength': 10000, 'description': 'What was produced (result, artifact) - AGENT FRIENDLY'}, 'reasoning': {'type': 'string', 'maxLength': 5000, 'description': 'Why this action was taken - AGENT FRIENDLY'}}, 'additionalProperties': False}, rule='additionalProperties')
+        if "metadata" in data_keys:
+            data_keys.remove("metadata")
+            data__metadata = data["metadata"]
+            if not isinstance(data__metadata, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".metadata must be object", value=data__metadata, name="" + (name_prefix or "data") + ".metadata", definition={'type': 'object', 'description': 'Additional metadata for the frame', 'properties': {'model_name': {'type': 'string'}, 'model_provider': {'type': 'string'}, 'token_usage': {'type': 'object', 'properties': {'prompt': {'type': 'integer'}, 'completion': {'type': 'integer'}, 'total': {'type': 'integer'}}, 'additionalProperties': False}, 'latency_ms': {'type': 'integer'}, 'risk_level': {'type': 'string', 'enum': ['low', 'medium', 'high']}, 'tags': {'type': 'array', 'items': {'type': 'string', 'maxLength': 64}, 'maxItems': 50}, 'tool_name': {'type': 'string'}, 'tool_args_hash': {'type': 'string'}, 'tool_output_hash': {'type': 'string'}}, 'additionalProperties': True}, rule='type')
+            data__metadata_is_dict = isinstance(data__metadata, dict)
+            if data__metadata_is_dict:
+                data__metadata_keys = set(data__metadata.keys())
+                if "model_name" in data__metadata_keys:
+                    data__metadata_keys.remove("model_name")
+                    data__metadata__modelname = data__metadata["model_name"]
+                    if not isinstance(data__metadata__modelname, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".metadata.model_name must be string", value=data__metadata__modelname, name="" + (name_prefix or "data") + ".metadata.model_name", definition={'type': 'string'}, rule='type')
+                if "model_provider" in data__metadata_keys:
+                    data__metadata_keys.remove("model_provider")
+                    data__metadata__modelprovider = data__metadata["model_provider"]
+                    if not isinstance(data__metadata__modelprovider, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".metadata.model_provider must be string", value=data__metadata__modelprovider, name="" + (name_prefix or "data") + ".metadata.model_provider", definition={'type': 'string'}, rule='type')
+                if "token_usage" in data__metadata_keys:
+                    data__metadata_keys.remove("token_usage")
+                    data__metadata__tokenusage = data__metadata["token_usage"]
+                    if not isinstance(data__metadata__tokenusage, (dict)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".metadata.token_usage must be object", value=data__metadata__tokenusage, name="" + (name_prefix or "data") + ".metadata.token_usage", definition={'type': 'object', 'properties': {'prompt': {'type': 'integer'}, 'completion': {'type': 'integer'}, 'total': {'type': 'integer'}}, 'additionalProperties': False}, rule='type')
+                    data__metadata__tokenusage_is_dict = isinstance(data__metadata__tokenusage, dict)
+                    if data__metadata__tokenusage_is_dict:
+                        data__metadata__tokenusage_keys = set(data__metadata__tokenusage.keys())
+                        if "prompt" in data__metadata__tokenusage_keys:
+                            data__metadata__tokenusage_keys.remove("prompt")
+                            data__metadata__tokenusage__prompt = data__metadata__tokenusage["prompt"]
+                            if not isinstance(data__metadata__tokenusage__prompt, (int)) and not (isinstance(data__metadata__tokenusage__prompt, float) and data__metadata__tokenusage__prompt.is_integer()) or isinstance(data__metadata__tokenusage__prompt, bool):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".metadata.token_usage.prompt must be integer", value=data__metadata__tokenusage__prompt, name="" + (name_prefix or "data") + ".metadata.token_usage.prompt", definition={'type': 'integer'}, rule='type')
+                        if "completion" in data__metadata__tokenusage_keys:
+                            data__metadata__tokenusage_keys.remove("completion")
+                            data__metadata__tokenusage__completion = data__metadata__tokenusage["completion"]
+                            if not isinstance(data__metadata__tokenusage__completion, (int)) and not (isinstance(data__metadata__tokenusage__completion, float) and data__metadata__tokenusage__completion.is_integer()) or isinstance(data__metadata__tokenusage__completion, bool):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".metadata.token_usage.completion must be integer", value=data__metadata__tokenusage__completion, name="" + (name_prefix or "data") + ".metadata.token_usage.completion", definition={'type': 'integer'}, rule='type')
+                        if "total" in data__metadata__tokenusage_keys:
+                            data__metadata__tokenusage_keys.remove("total")
+                            data__metadata__tokenusage__total = data__metadata__tokenusage["total"]
+                            if not isinstance(data__metadata__tokenusage__total, (int)) and not (isinstance(data__metadata__tokenusage__total, float) and data__metadata__tokenusage__total.is_integer()) or isinstance(data__metadata__tokenusage__total, bool):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".metadata.token_usage.total must be integer", value=data__metadata__tokenusage__total, name="" + (name_prefix or "data") + ".metadata.token_usage.total", definition={'type': 'integer'}, rule='type')
+                        if data__metadata__tokenusage_keys:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".metadata.token_usage must not contain "+str(data__metadata__tokenusage_keys)+" properties", value=data__metadata__tokenusage, name="" + (name_prefix or "data") + ".metadata.token_usage", definition={'type': 'object', 'properties': {'prompt': {'type': 'integer'}, 'completion': {'type': 'integer'}, 'total': {'type': 'integer'}}, 'additionalProperties': False}, rule='additionalProperties')
+                if "latency_ms" in data__metadata_keys:
+                    data__metadata_keys.remove("latency_ms")
+                    data__metadata__latencyms = data__metadata["latency_ms"]
+                    if not isinstance(data__metadata__latencyms, (int)) and not (isinstance(data__metadata__latencyms, float) and data__metadata__latencyms.is_integer()) or isinstance(data__metadata__latencyms, bool):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".metadata.latency_ms must be integer", value=data__metadata__latencyms, name="" + (name_prefix or "data") + ".metadata.latency_ms", definition={'type': 'integer'}, rule='type')
+                if "risk_level" in data__metadata_keys:
+                    data__metadata_keys.remove("risk_level")
+                    data__metadata__risklevel = data__metadata["risk_level"]
+                    if not isinstance(data__metadata__risklevel, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".metadata.risk_level must be string", value=data__metadata__risklevel, name="" + (name_prefix or "data") + ".metadata.risk_level", definition={'type': 'string', 'enum': ['low', 'medium', 'high']}, rule='type')
+                    if not (isinstance(data__metadata__risklevel, str) and data__metadata__risklevel == 'low' or isinstance(data__metadata__risklevel, str) and data__metadata__risklevel == 'medium' or isinstance(data__metadata__risklevel, str) and data__metadata__risklevel == 'high'):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".metadata.risk_level must be one of ['low', 'medium', 'high']", value=data__metadata__risklevel, name="" + (name_prefix or "data") + ".metadata.risk_level", definition={'type': 'string', 'enum': ['low', 'medium', 'high']}, rule='enum')
+                if "tags" in data__metadata_keys:
+                    data__metadata_keys.remove("tags")
+                    data__metadata__tags = data__metadata["tags"]
+                    if not isinstance(data__metadata__tags, (list, tuple)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".metadata.tags must be array", value=data__metadata__tags, name="" + (name_prefix or "data") + ".metadata.tags", definition={'type': 'array', 'items': {'type': 'string', 'maxLength': 64}, 'maxItems': 50}, rule='type')
+                    data__metadata__tags_is_list = isinstance(data__metadata__tags, (list, tuple))
+                    if data__metadata__tags_is_list:
+                        data__metadata__tags_len = len(data__metadata__tags)
+                        if data__metadata__tags_len > 50:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".metadata.tags must contain less than or equal to 50 items", value=data__metadata__tags, name="" + (name_prefix or "data") + ".metadata.tags", definition={'type': 'array', 'items': {'type': 'string', 'maxLength': 64}, 'maxItems': 50}, rule='maxItems')
+                        for data__metadata__tags_x, data__metadata__tags_item in enumerate(data__metadata__tags):
+                            if not isinstance(data__metadata__tags_item, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".metadata.tags[{data__metadata__tags_x}]".format(**locals()) + " must be string", value=data__metadata__tags_item, name="" + (name_prefix or "data") + ".metadata.tags[{data__metadata__tags_x}]".format(**locals()) + "", definition={'type': 'string', 'maxLength': 64}, rule='type')
+                            if isinstance(data__metadata__tags_item, str):
+                                data__metadata__tags_item_len = len(data__metadata__tags_item)
+                                if data__metadata__tags_item_len > 64:
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".metadata.tags[{data__metadata__tags_x}]".format(**locals()) + " must be shorter than or equal to 64 characters", value=data__metadata__tags_item, name="" + (name_prefix or "data") + ".metadata.tags[{data__metadata__tags_x}]".format(**locals()) + "", definition={'type': 'string', 'maxLength': 64}, rule='maxLength')
+                if "tool_name" in data__metadata_keys:
+                    data__metadata_keys.remove("tool_name")
+                    data__metadata__toolname = data__metadata["tool_name"]
+                    if not isinstance(data__metadata__toolname, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".metadata.tool_name must be string", value=data__metadata__toolname, name="" + (name_prefix or "data") + ".metadata.tool_name", definition={'type': 'string'}, rule='type')
+                if "tool_args_hash" in data__metadata_keys:
+                    data__metadata_keys.remove("tool_args_hash")
+                    data__metadata__toolargshash = data__metadata["tool_args_hash"]
+                    if not isinstance(data__metadata__toolargshash, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".metadata.tool_args_hash must be string", value=data__metadata__toolargshash, name="" + (name_prefix or "data") + ".metadata.tool_args_hash", definition={'type': 'string'}, rule='type')
+                if "tool_output_hash" in data__metadata_keys:
+                    data__metadata_keys.remove("tool_output_hash")
+                    data__metadata__tooloutputhash = data__metadata["tool_output_hash"]
+                    if not isinstance(data__metadata__tooloutputhash, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".metadata.tool_output_hash must be string", value=data__metadata__tooloutputhash, name="" + (name_prefix or "data") + ".metadata.tool_output_hash", definition={'type': 'string'}, rule='type')
+        if "vector_key" in data_keys:
+            data_keys.remove("vector_key")
+            data__vectorkey = data["vector_key"]
+            if not isinstance(data__vectorkey, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".vector_key must be string", value=data__vectorkey, name="" + (name_prefix or "data") + ".vector_key", definition={'type': 'string', 'maxLength': 512, 'description': 'Key for vector search indexing'}, rule='type')
+            if isinstance(data__vectorkey, str):
+                data__vectorkey_len = len(data__vectorkey)
+                if data__vectorkey_len > 512:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".vector_key must be shorter than or equal to 512 characters", value=data__vectorkey, name="" + (name_prefix or "data") + ".vector_key", definition={'type': 'string', 'maxLength': 512, 'description': 'Key for vector search indexing'}, rule='maxLength')
+        if "prev_hash" in data_keys:
+            data_keys.remove("prev_hash")
+            data__prevhash = data["prev_hash"]
+            if not isinstance(data__prevhash, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".prev_hash must be string", value=data__prevhash, name="" + (name_prefix or "data") + ".prev_hash", definition={'type': 'string', 'description': 'Hash of the previous frame (empty string for first frame)'}, rule='type')
+        if "frame_hash" in data_keys:
+            data_keys.remove("frame_hash")
+            data__framehash = data["frame_hash"]
+            if not isinstance(data__framehash, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".frame_hash must be string", value=data__framehash, name="" + (name_prefix or "data") + ".frame_hash", definition={'type': 'string', 'description': "SHA-256 hash of this frame's canonical representation"}, rule='type')
+        if "success" in data_keys:
+            data_keys.remove("success")
+            data__success = data["success"]
+            if not isinstance(data__success, (bool)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".success must be boolean", value=data__success, name="" + (name_prefix or "data") + ".success", definition={'type': 'boolean', 'description': 'Whether the action succeeded - AGENT FRIENDLY'}, rule='type')
+        if "caused_by" in data_keys:
+            data_keys.remove("caused_by")
+            data__causedby = data["caused_by"]
+            if not isinstance(data__causedby, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".caused_by must be string", value=data__causedby, name="" + (name_prefix or "data") + ".caused_by", definition={'type': 'string', 'description': 'frame_id of the event that triggered this action - AGENT FRIENDLY'}, rule='type')
+        if "artifacts" in data_keys:
+            data_keys.remove("artifacts")
+            data__artifacts = data["artifacts"]
+            if not isinstance(data__artifacts, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".artifacts must be array", value=data__artifacts, name="" + (name_prefix or "data") + ".artifacts", definition={'type': 'array', 'items': {'type': 'string', 'maxLength': 500}, 'maxItems': 100, 'description': 'List of files/resources created or modified - AGENT FRIENDLY'}, rule='type')
+            data__artifacts_is_list = isinstance(data__artifacts, (list, tuple))
+            if data__artifacts_is_list:
+                data__artifacts_len = len(data__artifacts)
+                if data__artifacts_len > 100:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".artifacts must contain less than or equal to 100 items", value=data__artifacts, name="" + (name_prefix or "data") + ".artifacts", definition={'type': 'array', 'items': {'type': 'string', 'maxLength': 500}, 'maxItems': 100, 'description': 'List of files/resources created or modified - AGENT FRIENDLY'}, rule='maxItems')
+                for data__artifacts_x, data__artifacts_item in enumerate(data__artifacts):
+                    if not isinstance(data__artifacts_item, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".artifacts[{data__artifacts_x}]".format(**locals()) + " must be string", value=data__artifacts_item, name="" + (name_prefix or "data") + ".artifacts[{data__artifacts_x}]".format(**locals()) + "", definition={'type': 'string', 'maxLength': 500}, rule='type')
+                    if isinstance(data__artifacts_item, str):
+                        data__artifacts_item_len = len(data__artifacts_item)
+                        if data__artifacts_item_len > 500:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".artifacts[{data__artifacts_x}]".format(**locals()) + " must be shorter than or equal to 500 characters", value=data__artifacts_item, name="" + (name_prefix or "data") + ".artifacts[{data__artifacts_x}]".format(**locals()) + "", definition={'type': 'string', 'maxLength': 500}, rule='maxLength')
+        if data_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must not contain "+str(data_keys)+" properties", value=data, name="" + (name_prefix or "data") + "", definition={'$schema': 'http://json-schema.org/draft-07/schema#', '$id': 'https://axiom-trace.dev/schemas/axiom_frame_v1_2.json', 'title': 'Axiom Frame v1.2', 'description': 'Schema for a single immutable event record in the Axiom Trace vault. v1.2 adds agent-friendly fields for retrospection.', 'type': 'object', 'required': ['frame_id', 'session_id', 'timestamp', 'event_type', 'actor', 'content', 'metadata', 'vector_key', 'prev_hash', 'frame_hash'], 'properties': {'frame_id': {'type': 'string', 'format': 'uuid', 'description': 'UUIDv4 identifier for this frame'}, 'session_id': {'type': 'string', 'description': 'Identifier for the session this frame belongs to'}, 'timestamp': {'type': 'string', 'format': 'date-time', 'description': 'ISO-8601 UTC timestamp with milliseconds'}, 'event_type': {'type': 'string', 'description': 'Type of event this frame represents'}, 'actor': {'type': 'object', 'required': ['type', 'id'], 'properties': {'type': {'type': 'string', 'enum': ['agent', 'user', 'system', 'tool'], 'description': 'Type of actor'}, 'id': {'type': 'string', 'maxLength': 128, 'description': 'Unique identifier for the actor'}, 'name': {'type': 'string', 'maxLength': 128, 'description': 'Optional human-readable name'}}, 'additionalProperties': False}, 'content': {'type': 'object', 'description': 'Content of the frame with agent-friendly fields', 'properties': {'text': {'type': 'string', 'maxLength': 200000, 'description': 'Text content (max 200,000 chars)'}, 'json': {'type': 'object', 'description': 'JSON content (max 1,000,000 bytes serialized)'}, 'mime_type': {'type': 'string', 'default': 'text/plain', 'description': 'MIME type of content'}, 'rationale_summary': {'type': 'string', 'maxLength': 2000, 'description': 'Summary of reasoning (required for thought events)'}, 'raw_thought': {'type': 'string', 'maxLength': 50000, 'description': 'Raw thought content (optional)'}, 'input': {'type': 'string', 'maxLength': 10000, 'description': 'What prompted this action (user request, trigger) - AGENT FRIENDLY'}, 'output': {'type': 'string', 'maxLength': 10000, 'description': 'What was produced (result, artifact) - AGENT FRIENDLY'}, 'reasoning': {'type': 'string', 'maxLength': 5000, 'description': 'Why this action was taken - AGENT FRIENDLY'}}, 'additionalProperties': False}, 'metadata': {'type': 'object', 'description': 'Additional metadata for the frame', 'properties': {'model_name': {'type': 'string'}, 'model_provider': {'type': 'string'}, 'token_usage': {'type': 'object', 'properties': {'prompt': {'type': 'integer'}, 'completion': {'type': 'integer'}, 'total': {'type': 'integer'}}, 'additionalProperties': False}, 'latency_ms': {'type': 'integer'}, 'risk_level': {'type': 'string', 'enum': ['low', 'medium', 'high']}, 'tags': {'type': 'array', 'items': {'type': 'string', 'maxLength': 64}, 'maxItems': 50}, 'tool_name': {'type': 'string'}, 'tool_args_hash': {'type': 'string'}, 'tool_output_hash': {'type': 'string'}}, 'additionalProperties': True}, 'vector_key': {'type': 'string', 'maxLength': 512, 'description': 'Key for vector search indexing'}, 'prev_hash': {'type': 'string', 'description': 'Hash of the previous frame (empty string for first frame)'}, 'frame_hash': {'type': 'string', 'description': "SHA-256 hash of this frame's canonical representation"}, 'success': {'type': 'boolean', 'description': 'Whether the action succeeded - AGENT FRIENDLY'}, 'caused_by': {'type': 'string', 'description': 'frame_id of the event that triggered this action - AGENT FRIENDLY'}, 'artifacts': {'type': 'array', 'items': {'type': 'string', 'maxLength': 500}, 'maxItems': 100, 'description': 'List of files/resources created or modified - AGENT FRIENDLY'}}, 'additionalProperties': False, 'allOf': [{'if': {'properties': {'event_type': {'const': 'thought'}}, 'required': ['event_type']}, 'then': {'properties': {'content': {'required': ['rationale_summary']}}}}, {'if': {'properties': {'event_type': {'enum': ['tool_call', 'tool_output']}}, 'required': ['event_type']}, 'then': {'properties': {'metadata': {'required': ['tool_name']}}}}]}, rule='additionalProperties')
+    return data
+
+
+validate = validate_https___axiom_trace_dev_schemas_axiom_frame_v1_2_json
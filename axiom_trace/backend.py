@@ -11,7 +11,7 @@ import json
 import os
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any, Protocol, runtime_checkable
+from typing import Any, Iterator, Protocol, runtime_checkable
 
 import orjson
 
@@ -42,6 +42,10 @@ class MemoryBackend(Protocol):
         """Append a frame to storage."""
         ...
     
+    def flush(self) -> None:
+        """Persist frames appended since the last flush."""
+        ...
+    
     def hybrid_search(
         self, 
         query: str, 
@@ -55,6 +59,15 @@ class MemoryBackend(Protocol):
         """Get all frames in order."""
         ...
     
+    def iter_frames(self) -> Iterator[dict[str, Any]]:
+        """
+        Iterate over all frames in order, already parsed.
+        
+        The frame list is snapshotted when this is called, so frames
+        appended during iteration are not yielded.
+        """
+        ...
+    
     def get_frame_count(self) -> int:
         """Get the total number of frames."""
         ...
@@ -74,6 +87,10 @@ class InMemoryBackend:
         """Append a frame to storage."""
         self._frames.append(canonical_bytes)
     
+    def flush(self) -> None:
+        """Nothing to persist for in-memory storage."""
+        pass
+    
     def hybrid_search(
         self, 
         query: str, 
@@ -139,10 +156,18 @@ class InMemoryBackend:
         """Get all frames in order."""
         return list(self._frames)
     
+    def iter_frames(self) -> Iterator[dict[str, Any]]:
+        """Iterate over a snapshot of all frames in order, already parsed."""
+        return map(orjson.loads, list(self._frames))
+    
     def get_frame_count(self) -> int:
         """Get the total number of frames."""
         return len(self._frames)
     
+    def clear(self) -> None:
+        """Remove all frames from storage."""
+        self._frames.clear()
+    
     def close(self) -> None:
         """Close the backend."""
         pass
@@ -159,8 +184,14 @@ class MemvidBackend:
         MEMVID_API_KEY: API key for Memvid cloud features (optional)
     """
     
-    def __init__(self, vault_dir: str | Path, api_key: str | None = None):
+    def __init__(
+        self,
+        vault_dir: str | Path,
+        api_key: str | None = None,
+        fsync_enabled: bool = True
+    ):
         self.vault_dir = Path(vault_dir)
+        self.fsync_enabled = fsync_enabled
         self.vault_dir.mkdir(parents=True, exist_ok=True)
         
         # Get API key from parameter or environment
@@ -168,6 +199,7 @@ class MemvidBackend:
         
         self.mv2_path = self.vault_dir / "vault.mv2"
         self._frames_cache: list[bytes] = []
+        self._pending: list[bytes] = []
         self._encoder = None
         self._retriever = None
         
@@ -192,15 +224,28 @@ class MemvidBackend:
                 pass
     
     def append(self, canonical_bytes: bytes, vector_key: str) -> None:
-        """Append a frame to storage."""
+        """
+        Append a frame to storage.
+        
+        The frame is visible to reads immediately but only reaches
+        frames.jsonl on the next flush().
+        """
         self._frames_cache.append(canonical_bytes)
+        self._pending.append(canonical_bytes)
+    
+    def flush(self) -> None:
+        """Write buffered frames to the JSONL file with a single fsync."""
+        if not self._pending:
+            return
         
-        # Append to JSONL file for durability
         frames_file = self.vault_dir / "frames.jsonl"
         with open(frames_file, "ab") as f:
-            f.write(canonical_bytes + b"\n")
-            f.flush()
-            os.fsync(f.fileno())
+            f.write(b"\n".join(self._pending) + b"\n")
+            if self.fsync_enabled:
+                f.flush()
+                os.fsync(f.fileno())
+        
+        self._pending.clear()
     
     def build_index(self) -> None:
         """Build or rebuild the Memvid index."""
@@ -337,10 +382,30 @@ class MemvidBackend:
         """Get all frames in order."""
         return list(self._frames_cache)
     
+    def iter_frames(self) -> Iterator[dict[str, Any]]:
+        """Iterate over a snapshot of all frames in order, already parsed."""
+        return map(orjson.loads, list(self._frames_cache))
+    
     def get_frame_count(self) -> int:
         """Get the total number of frames."""
         return len(self._frames_cache)
     
+    def clear(self) -> None:
+        """
+        Remove all frames from storage, including the JSONL file.
+        
+        Does not touch the vault manifest; use AxiomTrace._reset() to
+        empty a vault without breaking its hash chain.
+        """
+        self._frames_cache.clear()
+        self._pending.clear()
+        self._retriever = None
+        
+        frames_file = self.vault_dir / "frames.jsonl"
+        if frames_file.exists():
+            frames_file.unlink()
+    
     def close(self) -> None:
-        """Close the backend and build index."""
+        """Flush buffered frames and build index."""
+        self.flush()
         self.build_index()
@@ -58,9 +58,8 @@ def compute_frame_hash(frame_without_hash: dict[str, Any], prev_hash: str) -> st
     # Canonicalize and hash
     canonical_bytes = canonicalize(frame_without_hash)
     
-    # Hash: canonical_frame + prev_hash
-    hasher = hashlib.sha256()
-    hasher.update(canonical_bytes)
+    # Hash: canonical_frame + prev_hash, fed straight from the orjson buffer
+    hasher = hashlib.sha256(canonical_bytes)
     hasher.update(prev_hash.encode("utf-8"))
     
     return hasher.hexdigest()
@@ -24,7 +24,7 @@ from filelock import FileLock, Timeout
 from axiom_trace.backend import AxiomLockError, MemvidBackend
 from axiom_trace.canonical import canonicalize, compute_frame_hash, verify_frame_hash
 from axiom_trace.redaction import redact_frame
-from axiom_trace.schema import AxiomValidationError, validate_frame
+from axiom_trace.schema import AxiomValidationError, validate_frame, validate_frames
 
 
 # Constants
@@ -51,6 +51,7 @@ class AxiomTrace:
         vault_dir: str | None = None,
         redaction_enabled: bool = True,
         auto_flush: bool = True,
+        fsync_enabled: bool = True,
         size_warning_gb: float = DEFAULT_SIZE_WARNING_GB,
         memvid_api_key: str | None = None
     ):
@@ -62,6 +63,8 @@ class AxiomTrace:
                       in the current working directory if not specified.
             redaction_enabled: Whether to enable automatic redaction
             auto_flush: Whether to enable automatic background flushing
+            fsync_enabled: Whether flushes fsync the frames file and manifest.
+                          Disable only for throwaway vaults (e.g. tests).
             size_warning_gb: Size threshold for warnings in GB
             memvid_api_key: Optional Memvid API key for cloud features
                            (can also be set via MEMVID_API_KEY env var)
@@ -74,6 +77,7 @@ class AxiomTrace:
         self.vault_dir.mkdir(parents=True, exist_ok=True)
         
         self.redaction_enabled = redaction_enabled
+        self.fsync_enabled = fsync_enabled
         self.size_warning_gb = size_warning_gb
         
         # Paths
@@ -82,7 +86,9 @@ class AxiomTrace:
         self.log_path = self.vault_dir / "axiom.log"
         
         # Initialize backend with optional API key
-        self._backend = MemvidBackend(self.vault_dir, api_key=memvid_api_key)
+        self._backend = MemvidBackend(
+            self.vault_dir, api_key=memvid_api_key, fsync_enabled=fsync_enabled
+        )
         
         # Queue for batched writes
         self._queue: list[dict[str, Any]] = []
@@ -125,8 +131,8 @@ class AxiomTrace:
     def _load_or_create_manifest(self) -> dict[str, Any]:
         """Load existing manifest or create a new one."""
         if self.manifest_path.exists():
-            with open(self.manifest_path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            with open(self.manifest_path, "rb") as f:
+                return orjson.loads(f.read())
         
         manifest = {
             "vault_version": VAULT_VERSION,
@@ -146,10 +152,11 @@ class AxiomTrace:
         """Save manifest atomically using tmp file + rename."""
         tmp_path = self.manifest_path.with_suffix(".json.tmp")
         
-        with open(tmp_path, "w", encoding="utf-8") as f:
-            json.dump(manifest, f, indent=2)
-            f.flush()
-            os.fsync(f.fileno())
+        with open(tmp_path, "wb") as f:
+            f.write(orjson.dumps(manifest, option=orjson.OPT_INDENT_2))
+            if self.fsync_enabled:
+                f.flush()
+                os.fsync(f.fileno())
         
         os.rename(tmp_path, self.manifest_path)
     
@@ -183,6 +190,60 @@ class AxiomTrace:
         Raises:
             AxiomValidationError: If event validation fails
         """
+        frame = self._build_frame(event)
+        
+        # Validate
+        validate_frame(frame)
+        
+        # Redact if enabled
+        if self.redaction_enabled:
+            frame = redact_frame(frame)
+        
+        # Add to queue
+        with self._queue_lock:
+            self._queue.append(frame)
+            
+            # Flush if queue is full
+            if len(self._queue) >= FLUSH_QUEUE_SIZE:
+                self._flush_queue_locked()
+        
+        logger.info(f"Recorded frame {frame['frame_id']}")
+        return frame["frame_id"]
+    
+    def record_many(self, events: list[dict[str, Any]]) -> list[str]:
+        """
+        Record a batch of events to the vault.
+        
+        Every event is validated before any is queued, so an invalid event
+        leaves the vault untouched. The batch is queued under a single lock
+        acquisition and keeps its order in the hash chain.
+        
+        Args:
+            events: Event dictionaries, in the same form accepted by record()
+            
+        Returns:
+            The frame_ids of the recorded frames, in input order
+            
+        Raises:
+            AxiomValidationError: If any event fails validation
+        """
+        frames = [self._build_frame(event) for event in events]
+        validate_frames(frames)
+        
+        if self.redaction_enabled:
+            frames = [redact_frame(frame) for frame in frames]
+        
+        with self._queue_lock:
+            self._queue.extend(frames)
+            
+            if len(self._queue) >= FLUSH_QUEUE_SIZE:
+                self._flush_queue_locked()
+        
+        logger.info(f"Recorded {len(frames)} frames")
+        return [frame["frame_id"] for frame in frames]
+    
+    def _build_frame(self, event: dict[str, Any]) -> dict[str, Any]:
+        """Build an unvalidated, unredacted frame from an event."""
         # Generate frame fields
         frame_id = str(uuid.uuid4())
         timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
@@ -225,23 +286,7 @@ class AxiomTrace:
         if "artifacts" in event:
             frame["artifacts"] = event["artifacts"]
         
-        # Validate
-        validate_frame(frame)
-        
-        # Redact if enabled
-        if self.redaction_enabled:
-            frame = redact_frame(frame)
-        
-        # Add to queue
-        with self._queue_lock:
-            self._queue.append(frame)
-            
-            # Flush if queue is full
-            if len(self._queue) >= FLUSH_QUEUE_SIZE:
-                self._flush_queue_locked()
-        
-        logger.info(f"Recorded frame {frame_id}")
-        return frame_id
+        return frame
     
     def record_action(
         self,
@@ -362,17 +407,18 @@ class AxiomTrace:
         try:
             # Reload manifest for latest head_hash
             if self.manifest_path.exists():
-                with open(self.manifest_path, "r", encoding="utf-8") as f:
-                    self._manifest = json.load(f)
+                with open(self.manifest_path, "rb") as f:
+                    self._manifest = orjson.loads(f.read())
             
             prev_hash = self._manifest["head_hash"]
             bytes_written = 0
             
             for frame in frames_to_write:
-                # Set prev_hash and compute frame_hash
+                # Set prev_hash and compute frame_hash over the frame itself;
+                # dropping the placeholder avoids copying the frame
                 frame["prev_hash"] = prev_hash
-                frame_without_hash = {k: v for k, v in frame.items() if k != "frame_hash"}
-                frame["frame_hash"] = compute_frame_hash(frame_without_hash, prev_hash)
+                frame.pop("frame_hash", None)
+                frame["frame_hash"] = compute_frame_hash(frame, prev_hash)
                 
                 # Canonicalize and write
                 canonical_bytes = canonicalize(frame)
@@ -381,6 +427,9 @@ class AxiomTrace:
                 prev_hash = frame["frame_hash"]
                 bytes_written += len(canonical_bytes)
             
+            # Persist frames before the manifest points at the new head
+            self._backend.flush()
+            
             # Update manifest
             self._manifest["head_hash"] = prev_hash
             self._manifest["frame_count"] += len(frames_to_write)
@@ -393,6 +442,35 @@ class AxiomTrace:
         finally:
             self._file_lock.release()
     
+    def _reset(self) -> None:
+        """
+        Empty the vault and restart its hash chain.
+        
+        Drops queued frames, clears the backend and rewrites the manifest
+        with an empty head_hash and zeroed counters, all under the vault
+        lock. Meant for throwaway vaults such as shared test fixtures;
+        the vault stays verifiable afterwards.
+        """
+        with self._queue_lock:
+            self._queue.clear()
+            
+            try:
+                self._file_lock.acquire()
+            except Timeout:
+                raise AxiomLockError("Failed to acquire vault lock")
+            
+            try:
+                self._backend.clear()
+                
+                self._manifest["head_hash"] = ""
+                self._manifest["frame_count"] = 0
+                self._manifest["bytes_written"] = 0
+                self._save_manifest_atomic(self._manifest)
+                
+                logger.info("Vault reset")
+            finally:
+                self._file_lock.release()
+    
     def query(
         self, 
         prompt: str, 
@@ -489,11 +567,9 @@ class AxiomTrace:
         self.flush()
         
         # Get all frames for session
-        all_frames = self._backend.get_all_frames()
         session_frames = []
         
-        for frame_bytes in all_frames:
-            frame = orjson.loads(frame_bytes)
+        for frame in self._backend.iter_frames():
             if frame.get("session_id") == session_id:
                 session_frames.append(frame)
         
@@ -593,24 +669,17 @@ class AxiomTrace:
         Returns:
             Dict with ok, checked_frames, head_hash, and error fields
         """
-        # Flush first
-        self.flush()
-        
-        all_frames = self._backend.get_all_frames()
-        
-        if not all_frames:
-            return {
-                "ok": True,
-                "checked_frames": 0,
-                "head_hash": "",
-                "error": None
-            }
+        # Flush, then snapshot frames and manifest head together so the
+        # flush thread cannot advance one without the other
+        with self._queue_lock:
+            self._flush_queue_locked()
+            frames = self._backend.iter_frames()
+            manifest_head = self._manifest.get("head_hash", "")
         
         prev_hash = ""
+        checked_frames = 0
         
-        for i, frame_bytes in enumerate(all_frames):
-            frame = orjson.loads(frame_bytes)
-            
+        for i, frame in enumerate(frames):
             # Verify prev_hash chain
             expected_prev = prev_hash
             actual_prev = frame.get("prev_hash", "")
@@ -633,20 +702,20 @@ class AxiomTrace:
                 }
             
             prev_hash = frame["frame_hash"]
+            checked_frames = i + 1
         
         # Verify manifest head_hash
-        manifest_head = self._manifest.get("head_hash", "")
         if manifest_head and manifest_head != prev_hash:
             return {
                 "ok": False,
-                "checked_frames": len(all_frames),
+                "checked_frames": checked_frames,
                 "head_hash": prev_hash,
                 "error": f"Manifest head_hash mismatch (manifest: {manifest_head[:16]}..., computed: {prev_hash[:16]}...)"
             }
         
         return {
             "ok": True,
-            "checked_frames": len(all_frames),
+            "checked_frames": checked_frames,
             "head_hash": prev_hash,
             "error": None
         }
@@ -678,13 +747,25 @@ class AxiomTrace:
             "over_limit": size_gb > self.size_warning_gb
         }
     
-    def close(self) -> None:
-        """Close the vault and flush pending data."""
+    def close(self, persist: bool = True) -> None:
+        """
+        Close the vault and flush pending data.
+        
+        Args:
+            persist: Whether to write queued frames and build the index.
+                    Pass False to discard them, e.g. for throwaway vaults.
+        """
         # Stop flush thread
         self._stop_flush.set()
         if self._flush_thread and self._flush_thread.is_alive():
             self._flush_thread.join(timeout=5)
         
+        if not persist:
+            with self._queue_lock:
+                self._queue.clear()
+            logger.info("Vault closed without persisting")
+            return
+        
         # Final flush
         try:
             self.flush()
@@ -32,7 +32,7 @@ class QuickTrace:
     
     Features:
     - Zero configuration required
-    - Auto-creates vault in .axiom_trace/
+    - Auto-creates vault in .axiom_trace/ (or a given vault_dir)
     - Auto-generates session IDs
     - Simple method names (log, thought, tool, done, error)
     
@@ -45,7 +45,15 @@ class QuickTrace:
         trace.done("Processed 100 users")
     """
     
-    def __init__(self):
+    def __init__(self, vault_dir: str | None = None):
+        """
+        Create a lazily-initialized trace.
+        
+        Args:
+            vault_dir: Path to the vault directory. Defaults to '.axiom_trace/'
+                      in the working directory at first use.
+        """
+        self._vault_dir = vault_dir
         self._trace: AxiomTrace | None = None
         self._session_id: str | None = None
         self._initialized = False
@@ -53,7 +61,7 @@ class QuickTrace:
     def _ensure_initialized(self) -> AxiomTrace:
         """Lazy initialization of trace instance."""
         if not self._initialized:
-            self._trace = AxiomTrace()
+            self._trace = AxiomTrace(vault_dir=self._vault_dir)
             self._session_id = str(uuid.uuid4())
             self._initialized = True
             atexit.register(self._cleanup)
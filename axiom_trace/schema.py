@@ -1,32 +1,83 @@
 """
 JSON Schema validation for Axiom frames.
 
-Validates frames against the Axiom Frame v1.1 schema and enforces
-per-event-type required fields.
+Validates frames against the Axiom Frame v1.1 schema, including its
+per-event-type required fields. Uses the Rust-backed jsonschema-rs
+validator when installed, and a fastjsonschema-compiled one otherwise.
 """
 
 from __future__ import annotations
 
+import hashlib
 import json
+import os
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
+import fastjsonschema
 import jsonschema
+import orjson
 from jsonschema import Draft7Validator
 
+# Optional Rust-backed validator (pip install axiom-trace[fast])
+try:
+    import jsonschema_rs
+    JSONSCHEMA_RS_AVAILABLE = True
+except ImportError:
+    JSONSCHEMA_RS_AVAILABLE = False
+
 
 class AxiomValidationError(Exception):
-    """Raised when frame validation fails."""
+    """
+    Raised when frame validation fails.
+    
+    Attributes:
+        message: Human-readable summary
+        errors: One formatted message per validation error
+        missing: Dotted paths of required fields that are absent
+                (e.g. "frame_id", "content.rationale_summary")
+        invalid: Dotted paths of fields present with a bad value
+                ("root" for errors on the frame itself)
+    """
     
-    def __init__(self, message: str, errors: list[str] | None = None):
+    def __init__(
+        self,
+        message: str,
+        errors: list[str] | None = None,
+        missing: frozenset[str] = frozenset(),
+        invalid: frozenset[str] = frozenset()
+    ):
         super().__init__(message)
         self.message = message
         self.errors = errors or []
+        self.missing = missing
+        self.invalid = invalid
+
+
+# Trusted-producer mode: AXIOM_TRACE_FAST=1 turns frame validation into a
+# no-op. Only for producers that always build well-formed frames; invalid
+# frames are then written to the vault unchecked.
+def _fast_mode_from_env() -> bool:
+    """Read the AXIOM_TRACE_FAST flag; only "1" enables it."""
+    return os.environ.get("AXIOM_TRACE_FAST") == "1"
 
 
+AXIOM_TRACE_FAST = _fast_mode_from_env()
+
 # Load schema at module import time
 _SCHEMA_PATH = Path(__file__).parent / "schemas" / "axiom_frame_v1_1.json"
+
+# Formats are not checked, matching the jsonschema validator, and
+# defaults are not applied so frames are never modified in place
+_COMPILE_OPTIONS = {"use_formats": False, "use_default": False}
 _SCHEMA: dict[str, Any] | None = None
+_VALIDATOR: Callable[[dict[str, Any]], Any] | None = None
+_ERROR_VALIDATOR: Draft7Validator | None = None
+
+# Exceptions raised by the fast validators on an invalid frame
+_VALIDATION_ERRORS: tuple[type[Exception], ...] = (fastjsonschema.JsonSchemaValueException,)
+if JSONSCHEMA_RS_AVAILABLE:
+    _VALIDATION_ERRORS += (jsonschema_rs.ValidationError,)
 
 
 def _load_schema() -> dict[str, Any]:
@@ -38,65 +89,191 @@ def _load_schema() -> dict[str, Any]:
     return _SCHEMA
 
 
+def _schema_sha256() -> str:
+    """Hash the schema file, to detect a stale pre-compiled validator."""
+    return hashlib.sha256(_SCHEMA_PATH.read_bytes()).hexdigest()
+
+
+def _get_validator() -> Callable[[dict[str, Any]], Any]:
+    """
+    Get the compiled validation function (cached).
+    
+    Prefers jsonschema-rs when installed. Otherwise uses the pre-generated
+    axiom_trace._schema_compiled module when it matches the schema on
+    disk, and compiles with fastjsonschema at runtime if it does not.
+    Regenerate the module with tools/regen_schema.py.
+    """
+    global _VALIDATOR
+    if _VALIDATOR is None and JSONSCHEMA_RS_AVAILABLE:
+        _VALIDATOR = jsonschema_rs.Draft7Validator(
+            _load_schema(), validate_formats=False
+        ).validate
+    if _VALIDATOR is None:
+        try:
+            from axiom_trace import _schema_compiled
+        except ImportError:
+            _schema_compiled = None
+        
+        if _schema_compiled is not None and _schema_compiled.SCHEMA_SHA256 == _schema_sha256():
+            _VALIDATOR = _schema_compiled.validate
+        else:
+            _VALIDATOR = fastjsonschema.compile(_load_schema(), **_COMPILE_OPTIONS)
+    return _VALIDATOR
+
+
+def _get_error_validator() -> Draft7Validator:
+    """Build the validator used to collect detailed errors (cached)."""
+    global _ERROR_VALIDATOR
+    if _ERROR_VALIDATOR is None:
+        schema = _load_schema()
+        Draft7Validator.check_schema(schema)
+        _ERROR_VALIDATOR = Draft7Validator(schema)
+    return _ERROR_VALIDATOR
+
+
 def validate_frame(frame: dict[str, Any]) -> None:
     """
     Validate a frame against the Axiom Frame v1.1 schema.
     
-    Also enforces per-event-type required fields:
+    The schema also enforces per-event-type required fields:
     - thought: content.rationale_summary required
     - tool_call: metadata.tool_name required
     - tool_output: metadata.tool_name required
     
+    Valid frames only pay for the compiled check; the slower jsonschema
+    pass runs on failure to report every error. Does nothing when
+    AXIOM_TRACE_FAST=1 is set.
+    
     Args:
         frame: The frame dictionary to validate
         
     Raises:
         AxiomValidationError: If validation fails
     """
-    schema = _load_schema()
-    validator = Draft7Validator(schema)
+    if AXIOM_TRACE_FAST:
+        return
     
-    # Collect all validation errors
-    errors = list(validator.iter_errors(frame))
+    error = _check_frame(frame, _get_validator())
+    if error is not None:
+        raise error
+
+
+def validate_frames(frames: list[dict[str, Any]]) -> None:
+    """
+    Validate a batch of frames, stopping at the first invalid one.
     
-    if errors:
-        error_messages = [_format_error(e) for e in errors]
-        raise AxiomValidationError(
-            f"Frame validation failed with {len(errors)} error(s)",
-            error_messages
-        )
+    Equivalent to calling validate_frame() on each frame, but looks up
+    the compiled validator once for the whole batch. Does nothing when
+    AXIOM_TRACE_FAST=1 is set.
     
-    # Per-event-type validation
-    event_type = frame.get("event_type")
-    content = frame.get("content", {})
-    metadata = frame.get("metadata", {})
+    Args:
+        frames: The frame dictionaries to validate
     
-    if event_type == "thought":
-        if "rationale_summary" not in content:
-            raise AxiomValidationError(
-                "thought events require content.rationale_summary",
-                ["content.rationale_summary is required for thought events"]
-            )
+    Raises:
+        AxiomValidationError: If any frame fails validation; the message
+            names the index of the failing frame
+    """
+    if AXIOM_TRACE_FAST:
+        return
     
-    if event_type in ("tool_call", "tool_output"):
-        if "tool_name" not in metadata:
+    validate = _get_validator()
+    for index, frame in enumerate(frames):
+        error = _check_frame(frame, validate)
+        if error is not None:
             raise AxiomValidationError(
-                f"{event_type} events require metadata.tool_name",
-                [f"metadata.tool_name is required for {event_type} events"]
+                f"frames[{index}]: {error.message}",
+                error.errors,
+                missing=error.missing,
+                invalid=error.invalid
             )
+
+
+def _check_frame(
+    frame: dict[str, Any],
+    validate: Callable[[dict[str, Any]], Any]
+) -> AxiomValidationError | None:
+    """Run all checks on a frame and return the error, if any."""
+    try:
+        validate(frame)
+    except _VALIDATION_ERRORS as e:
+        # Collect all validation errors
+        errors = list(_get_error_validator().iter_errors(frame))
+        error_messages = [_format_error(err) for err in errors] or [e.message]
+        
+        missing = set()
+        invalid = set()
+        for err in errors:
+            if err.validator == "required":
+                parent = _error_path(err)
+                missing.update(
+                    name if parent == "root" else f"{parent}.{name}"
+                    for name in err.validator_value
+                    if name not in err.instance
+                )
+            elif err.validator == "additionalProperties":
+                # Point at the unexpected keys, not the object holding them
+                parent = _error_path(err)
+                allowed = err.schema.get("properties", {})
+                invalid.update(
+                    str(key) if parent == "root" else f"{parent}.{key}"
+                    for key in err.instance
+                    if key not in allowed
+                )
+            else:
+                invalid.add(_error_path(err))
+        
+        return AxiomValidationError(
+            f"Frame validation failed with {len(error_messages)} error(s)",
+            error_messages,
+            missing=frozenset(missing),
+            invalid=frozenset(invalid)
+        )
+    except ValueError as e:
+        # jsonschema-rs raises a plain ValueError for Python values it
+        # cannot map to JSON, such as non-string dict keys
+        path = _find_non_string_key(frame) or "root"
+        return AxiomValidationError(
+            "Frame validation failed with 1 error(s)",
+            [f"{path}: {e}"],
+            invalid=frozenset({path})
+        )
     
     # Size limit for content.json
+    content = frame["content"]
     if "json" in content:
-        import orjson
         json_bytes = orjson.dumps(content["json"])
         if len(json_bytes) > 1_000_000:
-            raise AxiomValidationError(
+            return AxiomValidationError(
                 "content.json exceeds maximum size of 1,000,000 bytes",
-                [f"content.json is {len(json_bytes)} bytes, max is 1,000,000"]
+                [f"content.json is {len(json_bytes)} bytes, max is 1,000,000"],
+                invalid=frozenset({"content.json"})
             )
+    
+    return None
+
+
+def _find_non_string_key(value: Any, path: str = "") -> str | None:
+    """Dotted path of the first dict (depth-first) with a non-string key."""
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if not isinstance(key, str):
+                return path or "root"
+            found = _find_non_string_key(item, f"{path}.{key}" if path else key)
+            if found is not None:
+                return found
+    elif isinstance(value, list):
+        for index, item in enumerate(value):
+            found = _find_non_string_key(item, f"{path}.{index}" if path else str(index))
+            if found is not None:
+                return found
+    return None
+
+
+def _error_path(error: jsonschema.ValidationError) -> str:
+    """Dotted path of the value a validation error refers to."""
+    return ".".join(str(p) for p in error.absolute_path) if error.absolute_path else "root"
 
 
 def _format_error(error: jsonschema.ValidationError) -> str:
     """Format a validation error for display."""
-    path = ".".join(str(p) for p in error.absolute_path) if error.absolute_path else "root"
-    return f"{path}: {error.message}"
+    return f"{_error_path(error)}: {error.message}"
@@ -0,0 +1,90 @@
+"""
+Shared pytest fixtures.
+"""
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from axiom_trace import AxiomTrace, schema
+
+
+# RAM-backed filesystem on Linux; vaults there skip real disk I/O
+_TMPFS = Path("/dev/shm")
+
+
+def _first_frame(trace):
+    """Flush pending frames and return the first one, parsed."""
+    trace.flush()
+    return next(trace._backend.iter_frames())
+
+
+@pytest.fixture(autouse=True)
+def _validation_enabled(monkeypatch):
+    """Validate frames even if AXIOM_TRACE_FAST=1 is set in the shell."""
+    monkeypatch.setattr(schema, "AXIOM_TRACE_FAST", False)
+
+
+@pytest.fixture(scope="session")
+def vault_root(tmp_path_factory):
+    """Base directory for test vaults, on tmpfs when one is available."""
+    if _TMPFS.is_dir() and os.access(_TMPFS, os.W_OK):
+        root = Path(tempfile.mkdtemp(prefix="axiom-trace-", dir=_TMPFS))
+        yield root
+        shutil.rmtree(root, ignore_errors=True)
+    else:
+        yield tmp_path_factory.mktemp("vaults")
+
+
+@pytest.fixture
+def vault_dir(vault_root):
+    """Create an empty vault directory for one test."""
+    return tempfile.mkdtemp(dir=vault_root)
+
+
+@pytest.fixture(scope="module")
+def shared_trace(vault_root):
+    """Create one AxiomTrace per test module without the flush thread."""
+    t = AxiomTrace(
+        vault_dir=tempfile.mkdtemp(dir=vault_root),
+        auto_flush=False,
+        fsync_enabled=False
+    )
+    yield t
+    t.close(persist=False)
+
+
+@pytest.fixture
+def trace(shared_trace):
+    """Hand each test the module's shared trace, emptied after the test."""
+    yield shared_trace
+    shared_trace._reset()
+
+
+@pytest.fixture(scope="session")
+def global_quick_trace(vault_root):
+    """Initialize the global quick trace once, with its vault in a temp dir."""
+    from axiom_trace.quick import trace as quick_trace
+    
+    with pytest.MonkeyPatch.context() as mp:
+        mp.chdir(tempfile.mkdtemp(dir=vault_root))
+        quick_trace._ensure_initialized()
+    yield quick_trace
+    quick_trace.close()
+
+
+@pytest.fixture(scope="session")
+def validator():
+    """Return the frame validator, loaded once per test session."""
+    from axiom_trace.schema import validate_frame
+    
+    return validate_frame
+
+
+@pytest.fixture
+def first_frame():
+    """Return the helper that reads back a trace's first frame."""
+    return _first_frame
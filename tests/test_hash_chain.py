@@ -126,6 +126,21 @@ class TestHashComputation:
         # Should not raise and should compute correctly
         result = compute_frame_hash(frame, "")
         assert result != "should_be_ignored"
+    
+    @pytest.mark.parametrize("prev_hash,expected", [
+        ("", "afe04f63b7a44ff5b316c81e57607cfaec06e1e872699ac1a863ec30c4b00932"),
+        ("abc123", "d84c5996397e3f07ecdc6c27118a2b5295fe76179b6290510c4e574b074455dc"),
+    ])
+    def test_frame_hash_stable(self, prev_hash, expected):
+        """Hashes of existing vaults must not change between releases."""
+        frame = {
+            "frame_id": "550e8400-e29b-41d4-a716-446655440000",
+            "event_type": "thought",
+            "content": {"text": "test content", "rationale_summary": "pinned"},
+            "prev_hash": ""
+        }
+        
+        assert compute_frame_hash(frame, prev_hash) == expected
 
 
 class TestHashVerification:
@@ -94,6 +94,98 @@ class TestRecord:
         with AxiomTrace(temp_vault, auto_flush=False) as trace:
             stats = trace.stats()
             assert stats["frame_count"] == 1
+    
+    def test_record_many_returns_ids_in_order(self, temp_vault):
+        """record_many should return one frame_id per event, in order."""
+        with AxiomTrace(temp_vault, auto_flush=False) as trace:
+            ids = trace.record_many([
+                {"event_type": "user_input", "content": {"text": f"Message {i}"}}
+                for i in range(3)
+            ])
+            
+            trace.flush()
+            frames = list(trace._backend.iter_frames())
+            
+            assert [f["frame_id"] for f in frames] == ids
+            assert [f["content"]["text"] for f in frames] == ["Message 0", "Message 1", "Message 2"]
+    
+    def test_record_many_rejects_whole_batch(self, temp_vault):
+        """An invalid event should keep the whole batch out of the vault."""
+        with AxiomTrace(temp_vault, auto_flush=False) as trace:
+            with pytest.raises(AxiomValidationError):
+                trace.record_many([
+                    {"event_type": "user_input", "content": {"text": "Valid"}},
+                    {"event_type": "thought", "content": {"text": "No rationale"}},
+                ])
+            
+            trace.flush()
+            assert trace._backend.get_frame_count() == 0
+    
+    def test_flush_writes_buffered_frames(self, temp_vault):
+        """Backend appends should only reach frames.jsonl on flush."""
+        frames_file = Path(temp_vault) / "frames.jsonl"
+        
+        with AxiomTrace(temp_vault, auto_flush=False) as trace:
+            trace._backend.append(b'{"a":1}', "a")
+            trace._backend.append(b'{"b":2}', "b")
+            assert not frames_file.exists()
+            assert trace._backend.get_frame_count() == 2
+            
+            trace._backend.flush()
+            assert frames_file.read_bytes().splitlines() == [b'{"a":1}', b'{"b":2}']
+    
+    def test_iter_frames_is_a_snapshot(self, temp_vault):
+        """Frames appended after iter_frames() is called should not be yielded."""
+        with AxiomTrace(temp_vault, auto_flush=False) as trace:
+            trace._backend.append(b'{"a":1}', "a")
+            frames = trace._backend.iter_frames()
+            trace._backend.append(b'{"b":2}', "b")
+            
+            assert list(frames) == [{"a": 1}]
+    
+    def test_reset_removes_frames(self, temp_vault):
+        """Resetting should drop all frames and leave a verifiable vault."""
+        with AxiomTrace(temp_vault, auto_flush=False) as trace:
+            trace.record({
+                "event_type": "thought",
+                "content": {"text": "Temporary", "rationale_summary": "Cleared"}
+            })
+            trace.flush()
+            
+            trace._reset()
+            assert trace._backend.get_all_frames() == []
+            assert trace.verify_integrity()["ok"] is True
+            assert trace.stats()["frame_count"] == 0
+            
+            # New frames start a fresh chain
+            trace.record({"event_type": "user_input", "content": {"text": "After reset"}})
+            trace.flush()
+            assert trace.verify_integrity()["ok"] is True
+            assert trace.stats()["frame_count"] == 1
+        
+        with AxiomTrace(temp_vault, auto_flush=False) as trace:
+            assert trace._backend.get_frame_count() == 1
+            assert trace.verify_integrity()["ok"] is True
+    
+    def test_close_without_persist_discards_queue(self, temp_vault):
+        """close(persist=False) should drop queued frames instead of writing them."""
+        trace = AxiomTrace(temp_vault, auto_flush=False, fsync_enabled=False)
+        trace.record({"event_type": "user_input", "content": {"text": "Dropped"}})
+        trace.close(persist=False)
+        
+        assert not (Path(temp_vault) / "frames.jsonl").exists()
+        
+        with AxiomTrace(temp_vault, auto_flush=False) as trace:
+            assert trace.stats()["frame_count"] == 0
+    
+    def test_flush_without_fsync_still_writes(self, temp_vault):
+        """Disabling fsync should not stop frames reaching the vault."""
+        with AxiomTrace(temp_vault, auto_flush=False, fsync_enabled=False) as trace:
+            trace.record({"event_type": "user_input", "content": {"text": "Kept"}})
+        
+        with AxiomTrace(temp_vault, auto_flush=False) as trace:
+            assert trace.stats()["frame_count"] == 1
+            assert trace.verify_integrity()["ok"] is True
 
 
 class TestQuery:
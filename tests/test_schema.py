@@ -4,159 +4,138 @@ Tests for JSON schema validation.
 
 import pytest
 
-from axiom_trace.schema import AxiomValidationError, validate_frame
+from axiom_trace import schema
+from axiom_trace.schema import AxiomValidationError, validate_frames
+
+
+# Shared by every make_valid_frame() call; nested dicts must not be mutated
+_FRAME_TEMPLATE = {
+    "frame_id": "550e8400-e29b-41d4-a716-446655440000",
+    "session_id": "660e8400-e29b-41d4-a716-446655440000",
+    "timestamp": "2026-01-08T22:14:05.123Z",
+    "event_type": "thought",
+    "actor": {"type": "agent", "id": "test-agent"},
+    "content": {
+        "text": "This is a test thought",
+        "rationale_summary": "Testing the system"
+    },
+    "metadata": {},
+    "vector_key": "thought | Testing the system",
+    "prev_hash": "",
+    "frame_hash": "abc123"
+}
 
 
 def make_valid_frame(**overrides):
     """Create a valid frame with optional overrides."""
-    frame = {
-        "frame_id": "550e8400-e29b-41d4-a716-446655440000",
-        "session_id": "660e8400-e29b-41d4-a716-446655440000",
-        "timestamp": "2026-01-08T22:14:05.123Z",
-        "event_type": "thought",
-        "actor": {"type": "agent", "id": "test-agent"},
-        "content": {
-            "text": "This is a test thought",
-            "rationale_summary": "Testing the system"
-        },
-        "metadata": {},
-        "vector_key": "thought | Testing the system",
-        "prev_hash": "",
-        "frame_hash": "abc123"
-    }
-    frame.update(overrides)
-    return frame
+    return {**_FRAME_TEMPLATE, **overrides}
 
 
 class TestValidFrame:
     """Test valid frame scenarios."""
     
-    def test_valid_thought_frame(self):
+    def test_valid_thought_frame(self, validator):
         """Valid thought frame should pass validation."""
         frame = make_valid_frame()
-        validate_frame(frame)  # Should not raise
+        validator(frame)  # Should not raise
     
-    def test_valid_tool_call_frame(self):
+    def test_valid_tool_call_frame(self, validator):
         """Valid tool_call frame should pass validation."""
         frame = make_valid_frame(
             event_type="tool_call",
             content={"json": {"tool": "search", "args": {"query": "test"}}},
             metadata={"tool_name": "search"}
         )
-        validate_frame(frame)
+        validator(frame)
     
-    def test_valid_user_input_frame(self):
+    def test_valid_user_input_frame(self, validator):
         """Valid user_input frame should pass validation."""
         frame = make_valid_frame(
             event_type="user_input",
             actor={"type": "user", "id": "user-1"},
             content={"text": "Hello agent"}
         )
-        validate_frame(frame)
+        validator(frame)
     
-    def test_valid_error_frame(self):
+    def test_valid_error_frame(self, validator):
         """Valid error frame should pass validation."""
         frame = make_valid_frame(
             event_type="error",
             content={"text": "Error occurred: division by zero"}
         )
-        validate_frame(frame)
+        validator(frame)
+    
+    def test_validation_does_not_modify_frame(self, validator):
+        """Validation should not fill in schema defaults such as mime_type."""
+        frame = make_valid_frame()
+        validator(frame)
+        assert "mime_type" not in frame["content"]
 
 
 class TestMissingRequiredFields:
     """Test missing required field scenarios."""
     
-    def test_missing_frame_id(self):
-        """Missing frame_id should fail validation."""
+    @pytest.mark.parametrize("field", [
+        "frame_id",
+        "session_id",
+        "timestamp",
+        "event_type",
+        "actor",
+        "content",
+        "metadata",
+        "vector_key",
+        "prev_hash",
+        "frame_hash",
+    ])
+    def test_missing_required_field(self, validator, field):
+        """Missing a required top-level field should fail validation."""
         frame = make_valid_frame()
-        del frame["frame_id"]
+        del frame[field]
         
         with pytest.raises(AxiomValidationError) as exc_info:
-            validate_frame(frame)
-        assert "frame_id" in str(exc_info.value.errors)
-    
-    def test_missing_event_type(self):
-        """Missing event_type should fail validation."""
-        frame = make_valid_frame()
-        del frame["event_type"]
-        
-        with pytest.raises(AxiomValidationError):
-            validate_frame(frame)
-    
-    def test_missing_actor(self):
-        """Missing actor should fail validation."""
-        frame = make_valid_frame()
-        del frame["actor"]
-        
-        with pytest.raises(AxiomValidationError):
-            validate_frame(frame)
-    
-    def test_missing_content(self):
-        """Missing content should fail validation."""
-        frame = make_valid_frame()
-        del frame["content"]
-        
-        with pytest.raises(AxiomValidationError):
-            validate_frame(frame)
+            validator(frame)
+        assert field in exc_info.value.missing
 
 class TestInvalidEventType:
     """Test invalid event_type scenarios."""
     
-    def test_custom_event_type_is_allowed(self):
+    def test_custom_event_type_is_allowed(self, validator):
         """Custom event_type should pass validation in v1.2+."""
         frame = make_valid_frame(event_type="custom_observation")
         frame["content"] = {"text": "Custom event"}  # Remove rationale_summary requirement
-        validate_frame(frame)  # Should not raise in v1.2
+        validator(frame)  # Should not raise in v1.2
     
-    def test_empty_event_type_passes(self):
+    def test_empty_event_type_passes(self, validator):
         """Empty event_type now passes in v1.2 (schema is more permissive)."""
         frame = make_valid_frame(event_type="observation")
         frame["content"] = {"text": "Test"}
-        validate_frame(frame)  # Custom types allowed
+        validator(frame)  # Custom types allowed
 
 
 class TestPerEventTypeRequirements:
     """Test per-event-type required fields."""
     
-    def test_thought_requires_rationale_summary(self):
-        """thought events require content.rationale_summary."""
+    @pytest.mark.parametrize("event_type,content,missing", [
+        ("thought", {"text": "Just a thought"}, "content.rationale_summary"),
+        ("tool_call", {"json": {"tool": "search"}}, "metadata.tool_name"),
+        ("tool_output", {"text": "Search results"}, "metadata.tool_name"),
+    ])
+    def test_event_type_requires_field(self, validator, event_type, content, missing):
+        """thought needs content.rationale_summary; tool events need metadata.tool_name."""
         frame = make_valid_frame(
-            event_type="thought",
-            content={"text": "Just a thought"}  # Missing rationale_summary
+            event_type=event_type,
+            content=content,
+            metadata={}
         )
         
         with pytest.raises(AxiomValidationError) as exc_info:
-            validate_frame(frame)
-        assert "rationale_summary" in str(exc_info.value)
-    
-    def test_tool_call_requires_tool_name(self):
-        """tool_call events require metadata.tool_name."""
-        frame = make_valid_frame(
-            event_type="tool_call",
-            content={"json": {"tool": "search"}},
-            metadata={}  # Missing tool_name
-        )
-        
-        with pytest.raises(AxiomValidationError) as exc_info:
-            validate_frame(frame)
-        assert "tool_name" in str(exc_info.value)
-    
-    def test_tool_output_requires_tool_name(self):
-        """tool_output events require metadata.tool_name."""
-        frame = make_valid_frame(
-            event_type="tool_output",
-            content={"text": "Search results"},
-            metadata={}  # Missing tool_name
-        )
-        
-        with pytest.raises(AxiomValidationError) as exc_info:
-            validate_frame(frame)
-        assert "tool_name" in str(exc_info.value)
+            validator(frame)
+        assert exc_info.value.missing == {missing}
 
 class TestContentConstraints:
     """Test content constraints - v1.2 relaxed to allow agent-friendly fields."""
     
-    def test_content_with_both_text_and_json_is_allowed(self):
+    def test_content_with_both_text_and_json_is_allowed(self, validator):
         """Content with both text and json is now allowed in v1.2 for agent-friendly format."""
         frame = make_valid_frame(
             event_type="tool_call",
@@ -169,9 +148,9 @@ class TestContentConstraints:
             metadata={"tool_name": "test_tool"}
         )
         
-        validate_frame(frame)  # Should not raise in v1.2
+        validator(frame)  # Should not raise in v1.2
     
-    def test_content_with_just_input_output_reasoning(self):
+    def test_content_with_just_input_output_reasoning(self, validator):
         """Content with agent-friendly fields should work."""
         frame = make_valid_frame(
             event_type="tool_call",
@@ -184,26 +163,133 @@ class TestContentConstraints:
             metadata={"tool_name": "write_file"}
         )
         
-        validate_frame(frame)  # Should pass
+        validator(frame)  # Should pass
+
+
+class TestAdditionalProperties:
+    """Test that unknown fields are reported by key."""
+    
+    def test_extra_top_level_key(self, validator):
+        """An unknown top-level field should be reported by name."""
+        frame = {**make_valid_frame(), "foo": 1}
+        
+        with pytest.raises(AxiomValidationError) as exc_info:
+            validator(frame)
+        assert exc_info.value.invalid == {"foo"}
+    
+    def test_extra_nested_key(self, validator):
+        """An unknown nested field should be reported by its dotted path."""
+        frame = make_valid_frame(
+            event_type="user_input",
+            content={"text": "x", "bogus": 1}
+        )
+        
+        with pytest.raises(AxiomValidationError) as exc_info:
+            validator(frame)
+        assert exc_info.value.invalid == {"content.bogus"}
 
 
 class TestActorConstraints:
     """Test actor field constraints."""
     
-    def test_invalid_actor_type(self):
+    def test_invalid_actor_type(self, validator):
         """Invalid actor.type should fail validation."""
         frame = make_valid_frame(
             actor={"type": "invalid_actor", "id": "test"}
         )
         
-        with pytest.raises(AxiomValidationError):
-            validate_frame(frame)
+        with pytest.raises(AxiomValidationError) as exc_info:
+            validator(frame)
+        assert exc_info.value.invalid == {"actor.type"}
     
-    def test_missing_actor_id(self):
+    def test_missing_actor_id(self, validator):
         """Missing actor.id should fail validation."""
         frame = make_valid_frame(
             actor={"type": "agent"}  # Missing id
         )
         
-        with pytest.raises(AxiomValidationError):
-            validate_frame(frame)
+        with pytest.raises(AxiomValidationError) as exc_info:
+            validator(frame)
+        assert exc_info.value.missing == {"actor.id"}
+
+
+class TestValidateFrames:
+    """Test batch validation."""
+    
+    @pytest.mark.parametrize("count", [0, 1, 1000])
+    def test_valid_batch_passes(self, count):
+        """A batch of valid frames should pass validation."""
+        validate_frames([make_valid_frame()] * count)
+    
+    def test_error_names_failing_index(self):
+        """The error should point at the first invalid frame."""
+        frames = [
+            make_valid_frame(),
+            make_valid_frame(),
+            make_valid_frame(actor={"type": "agent"}),  # Missing id
+        ]
+        
+        with pytest.raises(AxiomValidationError) as exc_info:
+            validate_frames(frames)
+        assert str(exc_info.value).startswith("frames[2]: ")
+        assert exc_info.value.missing == {"actor.id"}
+
+
+class TestFastMode:
+    """Test the AXIOM_TRACE_FAST trusted-producer mode."""
+    
+    def test_fast_mode_skips_validation(self, validator, monkeypatch):
+        """With AXIOM_TRACE_FAST=1, malformed frames are not checked."""
+        monkeypatch.setattr(schema, "AXIOM_TRACE_FAST", True)
+        
+        frame = make_valid_frame(actor={"type": "invalid_actor"})
+        validator(frame)
+        validate_frames([frame])
+    
+    @pytest.mark.parametrize("value,expected", [("1", True), ("0", False), ("", False)])
+    def test_fast_mode_read_from_env(self, value, expected, monkeypatch):
+        """Only AXIOM_TRACE_FAST=1 should enable fast mode."""
+        monkeypatch.setenv("AXIOM_TRACE_FAST", value)
+        
+        assert schema._fast_mode_from_env() is expected
+    
+    def test_fast_mode_off_when_unset(self, monkeypatch):
+        """Fast mode should be off when the variable is not set."""
+        monkeypatch.delenv("AXIOM_TRACE_FAST", raising=False)
+        
+        assert schema._fast_mode_from_env() is False
+
+
+class TestCompiledValidator:
+    """Test the pre-compiled validator module."""
+    
+    def test_compiled_module_matches_schema(self):
+        """_schema_compiled.py must be regenerated when the schema changes."""
+        from axiom_trace import _schema_compiled
+        from axiom_trace.schema import _schema_sha256
+        
+        assert _schema_compiled.SCHEMA_SHA256 == _schema_sha256(), (
+            "Run tools/regen_schema.py to regenerate axiom_trace/_schema_compiled.py"
+        )
+    
+    def test_fastjsonschema_fallback(self, validator, monkeypatch):
+        """Without jsonschema-rs, the fastjsonschema validator should be used."""
+        monkeypatch.setattr(schema, "JSONSCHEMA_RS_AVAILABLE", False)
+        monkeypatch.setattr(schema, "_VALIDATOR", None)
+        
+        validator(make_valid_frame())
+        with pytest.raises(AxiomValidationError) as exc_info:
+            validator(make_valid_frame(content={"text": "No rationale"}))
+        assert exc_info.value.missing == {"content.rationale_summary"}
+        assert schema._VALIDATOR.__module__ == "axiom_trace._schema_compiled"
+
+    def test_jsonschema_rs_non_string_key(self, validator, monkeypatch):
+        """jsonschema-rs conversion errors should surface as AxiomValidationError."""
+        pytest.importorskip("jsonschema_rs")
+        monkeypatch.setattr(schema, "JSONSCHEMA_RS_AVAILABLE", True)
+        monkeypatch.setattr(schema, "_VALIDATOR", None)
+        
+        with pytest.raises(AxiomValidationError) as exc_info:
+            validator(make_valid_frame(metadata={1: "a"}))
+        assert exc_info.value.invalid == {"metadata"}
+        assert schema._VALIDATOR.__self__.__class__.__module__ == "jsonschema_rs"
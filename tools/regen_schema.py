@@ -0,0 +1,46 @@
+"""
+Regenerate axiom_trace/_schema_compiled.py from the frame schema.
+
+Run this after editing axiom_trace/schemas/axiom_frame_v1_1.json:
+
+    python tools/regen_schema.py
+"""
+
+import re
+import sys
+from pathlib import Path
+
+import fastjsonschema
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from axiom_trace.schema import _COMPILE_OPTIONS, _load_schema, _schema_sha256
+
+
+OUTPUT_PATH = ROOT / "axiom_trace" / "_schema_compiled.py"
+
+HEADER = '''"""
+Pre-compiled frame schema validator.
+
+Generated by tools/regen_schema.py - do not edit by hand.
+"""
+
+SCHEMA_SHA256 = "{sha256}"
+
+'''
+
+
+def main() -> None:
+    code = fastjsonschema.compile_to_code(_load_schema(), **_COMPILE_OPTIONS)
+    
+    # The entry point is named after the schema $id; expose it as validate
+    entry_point = re.search(r"^def (\w+)\(", code, re.MULTILINE).group(1)
+    code += f"\n\n\nvalidate = {entry_point}\n"
+    
+    OUTPUT_PATH.write_text(HEADER.format(sha256=_schema_sha256()) + code, encoding="utf-8")
+    print(f"Wrote {OUTPUT_PATH}")
+
+
+if __name__ == "__main__":
+    main()